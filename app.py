@@ -1,13 +1,19 @@
 # app.py
 import os
+import io
 import time
 import logging
+import pickle
+import base64
 import random
+import secrets
+import threading
+from collections import OrderedDict, deque
+from functools import lru_cache
 from heapq import heappop, heappush
-from itertools import count
 
 from flask import (
-    Flask, render_template_string, jsonify, request, url_for,
+    Flask, jsonify, request,
     session, send_from_directory
 )
 from werkzeug.utils import secure_filename
@@ -34,60 +40,128 @@ app.logger.info("8-puzzle service starting")
 # -----------------------------------------------------------------------------
 # Session helpers (multi-user safe)
 # -----------------------------------------------------------------------------
-def _get_state(): return session.get("state", [])
-def _set_state(s): session["state"] = s
-
-def _get_moves(): return session.get("moves", 0)
-def _set_moves(n): session["moves"] = n
-
-def _get_tiles(): return session.get("tiles", [])
-def _set_tiles(t): session["tiles"] = t
+# Game data lives server-side in an LRU keyed by a short id; the signed cookie
+# only carries that id, so it stays tiny however large the tiles are.
+MAX_SESSIONS = 1024
+SESSIONS: "OrderedDict[str, dict]" = OrderedDict()
+SESSIONS_LOCK = threading.Lock()
+
+def _peek():
+    sid = session.get("sid")
+    with SESSIONS_LOCK:
+        data = SESSIONS.get(sid) if sid else None
+        if data is not None:
+            SESSIONS.move_to_end(sid)
+    return data if data is not None else {}
+
+def _board():
+    sid = session.get("sid")
+    with SESSIONS_LOCK:
+        data = SESSIONS.get(sid) if sid else None
+        if data is None:
+            sid = secrets.token_urlsafe(12)
+            session["sid"] = sid
+            data = SESSIONS[sid] = {}
+            while len(SESSIONS) > MAX_SESSIONS:
+                SESSIONS.popitem(last=False)
+        else:
+            SESSIONS.move_to_end(sid)
+    return data
+
+# Boards are stored as 9-byte bytearrays (66 bytes vs 136 for a 9-int list) and
+# only ever modified in place by _slide_tile; convert with list() for JSON.
+def _get_state(): return _peek().get("state", bytearray())
+def _set_state(s):
+    board, pos = bytearray(s), tile_positions(s)
+    data = _board()
+    with SESSIONS_LOCK:  # board and positions must change together for _slide_tile
+        data["state"], data["tile_pos"] = board, pos
+
+def _slide_tile(tile):
+    """Move tile into the adjacent blank in place.
+
+    Returns a (state, moves, solved) snapshot taken under the lock; the board
+    is unchanged when tile is not next to the blank.
+    """
+    data = _peek()
+    with SESSIONS_LOCK:
+        st, pos = data.get("state"), data.get("tile_pos")
+        moves = data.get("moves", 0)
+        if not st or not 1 <= tile <= 8:
+            return list(st or ()), moves, False
+        blank, ti = pos[0], pos[tile]
+        if ti not in NBRS[blank]:
+            return list(st), moves, False
+        st[blank], st[ti] = tile, 0
+        pos[0], pos[tile] = ti, blank
+        data["moves"] = moves = moves + 1
+        return list(st), moves, pos == SOLVED_POS
+
+def _get_moves(): return _peek().get("moves", 0)
+def _set_moves(n): _board()["moves"] = n
+
+def _get_tiles(): return _peek().get("tiles", [])
+def _set_tiles(t): _board()["tiles"] = t
 
 def _clear_session():
-    for k in ("state", "moves", "tiles"):
-        session.pop(k, None)
+    _peek().clear()
 
 # -----------------------------------------------------------------------------
 # Utilities
 # -----------------------------------------------------------------------------
+# SOLVED_POS[v]: index of tile v on the goal board (blank last)
+SOLVED_STATE = list(range(1, 9)) + [0]
+SOLVED_POS = bytes([8, 0, 1, 2, 3, 4, 5, 6, 7])
+
+def tile_positions(state):
+    pos = bytearray(9)
+    for i, v in enumerate(state):
+        pos[v] = i
+    return pos
+
 def allowed_file(filename: str) -> bool:
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
 
 def is_solvable(state):
+    # Walk right-to-left keeping a bitmask of tiles already seen; the smaller
+    # tiles to the right of v are the set bits below bit v.
     inv = 0
-    for i in range(len(state)):
-        for j in range(i + 1, len(state)):
-            if state[i] and state[j] and state[i] > state[j]:
-                inv += 1
-    return inv % 2 == 0
+    seen = 0
+    for v in reversed(state):
+        if v:
+            inv += (seen & ((1 << v) - 1)).bit_count()
+            seen |= 1 << v
+    return inv & 1 == 0
 
 def shuffle_tiles(seed: int | None = None):
     rng = random.Random(seed)
-    state = list(range(1, 9)) + [0]
+    state = list(SOLVED_STATE)
     while True:
         rng.shuffle(state)
         if is_solvable(state):
             return state
 
-def split_image(img: Image.Image, upload_folder: str):
+def split_image(img: Image.Image):
     # crop to square center, then resize to 300x300
     w, h = img.size
     side = min(w, h)
     left = (w - side) // 2
     top = (h - side) // 2
-    img = img.crop((left, top, left + side, top + side)).resize((300, 300))
+    img = img.crop((left, top, left + side, top + side)).resize((300, 300), reducing_gap=2.0)
 
     tile_size = img.size[0] // 3
-    urls = []
+    uris = []
     for i in range(3):
         for j in range(3):
             L = j * tile_size
             U = i * tile_size
             tile = img.crop((L, U, L + tile_size, U + tile_size))
-            path = os.path.join(upload_folder, f"tile_{i}_{j}.png")
-            tile.save(path)
-            urls.append(url_for("static", filename=f"tile_{i}_{j}.png"))
-    return urls
+            # inline as data URIs: no disk writes and no per-tile HTTP fetches
+            buf = io.BytesIO()
+            tile.save(buf, "JPEG", quality=82)
+            data = base64.b64encode(buf.getvalue()).decode("ascii")
+            uris.append(f"data:image/jpeg;base64,{data}")
+    return uris
 
 # -----------------------------------------------------------------------------
 # Heuristics + A* with path
@@ -105,60 +179,232 @@ def h_manhattan(s):
 def h_misplaced(s):
     return sum(1 for i, v in enumerate(s) if v and v != i + 1)
 
+# Goal row/column of each tile value (-1 for the blank so it never joins a line)
+ROW_GOAL = (-1,) + tuple((v - 1) // 3 for v in range(1, 9))
+COL_GOAL = (-1,) + tuple((v - 1) % 3 for v in range(1, 9))
+
 def h_linear_conflict(s):
-    def conflicts(line):
-        vals = [v for v in line if v]
-        inv = 0
-        for i in range(len(vals)):
-            for j in range(i + 1, len(vals)):
-                if vals[i] > vals[j]:
-                    inv += 1
-        return inv
-
-    man = h_manhattan(s)
-    rows = sum(conflicts([s[r*3 + c] for c in range(3) if (s[r*3 + c] - 1) // 3 == r]) for r in range(3))
-    cols = sum(conflicts([s[r*3 + c] for r in range(3) if (s[r*3 + c] - 1) % 3 == c]) for c in range(3))
-    return man + 2 * (rows + cols)
+    # Tiles already in their goal row (or column) that appear in reverse order
+    # cost 2 extra moves per pair; other tiles are zeroed out of the line.
+    inv = 0
+    for r in range(3):
+        a, b, c = s[3 * r], s[3 * r + 1], s[3 * r + 2]
+        a = a if ROW_GOAL[a] == r else 0
+        b = b if ROW_GOAL[b] == r else 0
+        c = c if ROW_GOAL[c] == r else 0
+        inv += (a > b > 0) + (a > c > 0) + (b > c > 0)
+    for col in range(3):
+        a, b, c = s[col], s[col + 3], s[col + 6]
+        a = a if COL_GOAL[a] == col else 0
+        b = b if COL_GOAL[b] == col else 0
+        c = c if COL_GOAL[c] == col else 0
+        inv += (a > b > 0) + (a > c > 0) + (b > c > 0)
+    return h_manhattan(s) + 2 * inv
+
+# MDIST[v*9 + p]: Manhattan distance of tile v sitting at cell p (blank costs 0)
+MDIST = tuple(
+    abs((v - 1) // 3 - p // 3) + abs((v - 1) % 3 - p % 3) if v else 0
+    for v in range(9) for p in range(9)
+)
 
 HEURISTICS = {"manhattan": h_manhattan, "misplaced": h_misplaced, "linear": h_linear_conflict}
 
-def a_star_with_path(initial_state, heuristic="manhattan"):
-    h = HEURISTICS.get(heuristic, h_manhattan)
-    start = tuple(initial_state)
-    goal = tuple(range(1, 9)) + (0,)
+# Boards are packed 4 bits per tile into a single int (cell i -> bits 4*i..4*i+3)
+NBRS = (
+    (1, 3), (0, 2, 4), (1, 5),
+    (0, 4, 6), (1, 3, 5, 7), (2, 4, 8),
+    (3, 7), (4, 6, 8), (5, 7),
+)
+
+def encode(state):
+    packed = 0
+    for i, v in enumerate(state):
+        packed |= v << (4 * i)
+    return packed
+
+def decode(packed):
+    return tuple((packed >> (4 * i)) & 0xF for i in range(9))
+
+GOAL = encode(SOLVED_STATE)
+
+def _astar_impl(initial_state, heuristic):
+    # Returns (moves, [packed states]) from initial_state to GOAL, excluding the start
+    h = HEURISTICS[heuristic]
+    start = encode(initial_state)
+    if numba_astar is not None and h is h_manhattan:
+        return numba_astar(start, GOAL)
+    # Manhattan is updated per move from MDIST; other heuristics score the decoded board
+    incremental = h is h_manhattan
     parent = {start: None}
     g = {start: 0}
-    f = {start: h(start)}
+    # Entries are (f, state, zi, g, h): equal-f ties break on the packed state
     pq = []
-    heappush(pq, (f[start], next(count()), start))
+    h0 = h(initial_state)
+    heappush(pq, (h0, start, list(initial_state).index(0), 0, h0))
     while pq:
-        _, __, cur = heappop(pq)
-        if cur == goal:
+        _, cur, zi, gc, hc = heappop(pq)
+        if cur == GOAL:
             path = []
             while parent[cur] is not None:
                 path.append(cur)
                 cur = parent[cur]
             path.reverse()
             return len(path), path
-        zi = cur.index(0)
-        x, y = divmod(zi, 3)
-        nbrs = []
-        if x > 0: nbrs.append(zi - 3)
-        if x < 2: nbrs.append(zi + 3)
-        if y > 0: nbrs.append(zi - 1)
-        if y < 2: nbrs.append(zi + 1)
-        for ni in nbrs:
-            nxt = list(cur)
-            nxt[zi], nxt[ni] = nxt[ni], nxt[zi]
-            nxt = tuple(nxt)
-            ng = g[cur] + 1
+        if gc > g[cur]:
+            continue  # stale entry, a cheaper route was pushed later
+        ng = gc + 1
+        for ni in NBRS[zi]:
+            v = (cur >> (4 * ni)) & 0xF
+            nxt = cur ^ (v << (4 * ni)) ^ (v << (4 * zi))
             if nxt not in g or ng < g[nxt]:
                 parent[nxt] = cur
                 g[nxt] = ng
-                f[nxt] = ng + h(nxt)
-                heappush(pq, (f[nxt], next(count()), nxt))
+                hn = hc - MDIST[v * 9 + ni] + MDIST[v * 9 + zi] if incremental else h(decode(nxt))
+                heappush(pq, (ng + hn, nxt, ni, ng, hn))
     return -1, []
 
+@lru_cache(maxsize=4096)
+def astar_cached(packed, heur):
+    # A* is deterministic for a given (state, heuristic), so results are memoised
+    if packed == GOAL:
+        return 0, ()
+    moves, path = _astar_impl(decode(packed), heur)
+    return moves, tuple(path)
+
+def a_star_with_path(initial_state, heuristic="manhattan"):
+    if heuristic not in HEURISTICS:
+        heuristic = "manhattan"
+    moves, path = astar_cached(encode(initial_state), heuristic)
+    return moves, [decode(p) for p in path]
+
+def bidirectional_bfs(start, goal):
+    """Shortest path of packed states from start to goal (excluding start), or None.
+
+    Searches from both ends, always expanding a full layer of the smaller
+    frontier, so roughly 2*b^(d/2) nodes are visited instead of b^d.
+    """
+    if start == goal:
+        return []
+    parents = ({start: None}, {goal: None})
+    depths = ({start: 0}, {goal: 0})
+    frontiers = [[(start, decode(start).index(0))], [(goal, decode(goal).index(0))]]
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        parent, depth, other = parents[side], depths[side], depths[1 - side]
+        layer = []
+        meet, best = None, None
+        for cur, zi in frontiers[side]:
+            d = depth[cur] + 1
+            for ni in NBRS[zi]:
+                v = (cur >> (4 * ni)) & 0xF
+                nxt = cur ^ (v << (4 * ni)) ^ (v << (4 * zi))
+                if nxt in parent:
+                    continue
+                parent[nxt] = cur
+                depth[nxt] = d
+                layer.append((nxt, ni))
+                if nxt in other and (best is None or d + other[nxt] < best):
+                    meet, best = nxt, d + other[nxt]
+        if meet is not None:
+            path = []
+            cur = meet
+            while cur != start:
+                path.append(cur)
+                cur = parents[0][cur]
+            path.reverse()
+            cur = parents[1][meet]
+            while cur is not None:
+                path.append(cur)
+                cur = parents[1][cur]
+            return path
+        frontiers[side] = layer
+    return None
+
+# -----------------------------------------------------------------------------
+# Precomputed optimal-move tables (all 181,440 solvable states)
+# -----------------------------------------------------------------------------
+# Kept out of static/ so the pickle is never served; override with SOLVER_CACHE_DIR
+SOLVER_CACHE_DIR = os.getenv("SOLVER_CACHE_DIR", app.instance_path)
+SOLVED_TABLE_PATH = os.path.join(SOLVER_CACHE_DIR, "solved.pkl")
+
+def _build_tables():
+    # Reverse BFS from the goal: DIST[s] = optimal moves, NEXT[s] = neighbour one step closer
+    dist = {GOAL: 0}
+    nxt = {}
+    frontier = deque([(GOAL, 8)])
+    while frontier:
+        cur, zi = frontier.popleft()
+        d = dist[cur] + 1
+        for ni in NBRS[zi]:
+            v = (cur >> (4 * ni)) & 0xF
+            s = cur ^ (v << (4 * ni)) ^ (v << (4 * zi))
+            if s not in dist:
+                dist[s] = d
+                nxt[s] = cur
+                frontier.append((s, ni))
+    return dist, nxt
+
+def _load_tables():
+    try:
+        with open(SOLVED_TABLE_PATH, "rb") as fh:
+            return pickle.load(fh)
+    except Exception:
+        pass
+    t0 = time.time()
+    tables = _build_tables()
+    app.logger.info("solver_tables_built states=%d sec=%.2f", len(tables[0]), time.time() - t0)
+    try:
+        os.makedirs(SOLVER_CACHE_DIR, exist_ok=True)
+        tmp = SOLVED_TABLE_PATH + ".tmp"
+        with open(tmp, "wb") as fh:
+            pickle.dump(tables, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, SOLVED_TABLE_PATH)
+    except OSError:
+        app.logger.warning("solver_tables_not_persisted path=%s", SOLVED_TABLE_PATH)
+    return tables
+
+# SOLVER_TABLES=0 skips the tables (tens of MB) and searches per request instead:
+# /minimum-moves runs cached A* with the chosen heuristic (Numba kernel for
+# Manhattan when installed); /solve and /hint use bidirectional BFS.
+SOLVER_TABLES = os.getenv("SOLVER_TABLES", "1") != "0"
+DIST, NEXT = _load_tables() if SOLVER_TABLES else (None, None)
+
+# The optional Numba kernel (pip install numba) is only imported without tables,
+# since numba/llvmlite add ~100 MB RSS; warm it (or load its on-disk cache) here
+# so the first request does not pay for the JIT.
+numba_astar = None
+if not SOLVER_TABLES:
+    try:
+        from solver_numba import astar as numba_astar
+    except ImportError:
+        pass
+    else:
+        numba_astar(GOAL, GOAL)
+
+def optimal_moves(state, heuristic="manhattan"):
+    """Optimal move count from state to the goal, or None if unreachable."""
+    if DIST is not None:
+        return DIST.get(encode(state))
+    if not is_solvable(state):
+        return None
+    return a_star_with_path(state, heuristic)[0]
+
+def optimal_path(state):
+    """Optimal path from state to the goal (excluding state), or None if unreachable."""
+    cur = encode(state)
+    if NEXT is None:
+        if not is_solvable(state):
+            return None
+        path = bidirectional_bfs(cur, GOAL)
+        return None if path is None else [decode(p) for p in path]
+    if cur not in DIST:
+        return None
+    path = []
+    while cur != GOAL:
+        cur = NEXT[cur]
+        path.append(decode(cur))
+    return path
+
 # -----------------------------------------------------------------------------
 # Security headers (allow inline JS so the buttons work)
 # -----------------------------------------------------------------------------
@@ -174,60 +420,9 @@ def add_security_headers(resp):
     return resp
 
 # -----------------------------------------------------------------------------
-# Routes
+# Page template (compiled once at import instead of on every render)
 # -----------------------------------------------------------------------------
-@app.route("/favicon.ico")
-def favicon():
-    icon = os.path.join(UPLOAD_FOLDER, "favicon.ico")
-    if os.path.exists(icon):
-        return send_from_directory(UPLOAD_FOLDER, "favicon.ico", mimetype="image/x-icon")
-    return ("", 204)
-
-@app.route("/", methods=["GET", "POST"])
-def home():
-    # On plain GET (no shared state), clear session so a refresh starts from zero
-    if request.method == "GET" and not request.args.get("state"):
-        _clear_session()
-
-    if request.method == "POST":
-        if "file" not in request.files:
-            return "No file part", 400
-        f = request.files["file"]
-        if f.filename == "":
-            return "No selected file", 400
-        if not allowed_file(f.filename):
-            return "Invalid file type. Please upload PNG/JPG/JPEG/WEBP.", 400
-
-        filename = secure_filename(f.filename)
-        try:
-            img = Image.open(f.stream).convert("RGB")
-        except Exception:
-            return "Could not open image. Please try a different file.", 400
-
-        seed = request.form.get("seed")
-        _set_tiles(split_image(img, UPLOAD_FOLDER))
-        _set_state(shuffle_tiles(int(seed)) if (seed and seed.isdigit()) else shuffle_tiles())
-        _set_moves(0)
-        app.logger.info('new_game image_uploaded seed=%s filename="%s"', seed, filename)
-    else:
-        # Shared link support: /?state=1,2,3,4,5,6,7,8,0
-        qs = request.args.get("state")
-        if qs:
-            try:
-                st = [int(x) for x in qs.split(",")]
-                if len(st) == 9 and is_solvable(st):
-                    _set_state(st)
-                    _set_moves(0)
-                    app.logger.info("state_loaded_from_query")
-            except Exception:
-                pass
-
-    tiles = _get_tiles()
-    state = _get_state()
-    moves = _get_moves()
-
-    return render_template_string(
-        """
+HTML = """
 <!doctype html>
 <html lang="en">
 <head>
@@ -273,7 +468,13 @@ def home():
     <button onclick="resetGame()">Reset</button>
   </div>
 
-  <div id="grid" class="grid"></div>
+  <div id="grid" class="grid">
+    {%- for tile in state %}
+    {%- if tile == 0 %}<div class="tile blank"></div>
+    {%- else %}<div class="tile"{% if tiles %} style="background-image:url({{ tiles[tile-1] }})"{% endif %} onclick="moveTile({{ tile }})"></div>
+    {%- endif %}
+    {%- endfor %}
+  </div>
   <div class="row"><strong id="move-count">Moves: {{ moves }}</strong></div>
   <div id="status"></div>
 
@@ -368,52 +569,94 @@ def home():
       .then(()=> window.location.href = '/'); // reload empty
   }
 
-  renderGrid();
+  // the grid is server-rendered on load; only build it here when there is none
+  if(!grid.children.length){ renderGrid(); }
 </script>
 </body>
 </html>
-        """,
-        state=state,
-        moves=moves,
-        tiles=tiles,
-    )
+"""
+
+_TEMPLATE = app.jinja_env.from_string(HTML)
+
+# -----------------------------------------------------------------------------
+# Routes
+# -----------------------------------------------------------------------------
+@app.route("/favicon.ico")
+def favicon():
+    icon = os.path.join(UPLOAD_FOLDER, "favicon.ico")
+    if os.path.exists(icon):
+        return send_from_directory(UPLOAD_FOLDER, "favicon.ico", mimetype="image/x-icon")
+    return ("", 204)
+
+@app.route("/", methods=["GET", "POST"])
+def home():
+    # On plain GET (no shared state), clear session so a refresh starts from zero
+    if request.method == "GET" and not request.args.get("state"):
+        _clear_session()
+
+    if request.method == "POST":
+        if "file" not in request.files:
+            return "No file part", 400
+        f = request.files["file"]
+        if f.filename == "":
+            return "No selected file", 400
+        if not allowed_file(f.filename):
+            return "Invalid file type. Please upload PNG/JPG/JPEG/WEBP.", 400
+
+        filename = secure_filename(f.filename)
+        try:
+            img = Image.open(f.stream)
+            # JPEGs decode at 1/2..1/8 scale (still >= 600px); no-op for other formats
+            img.draft("RGB", (600, 600))
+            img = img.convert("RGB")
+        except Exception:
+            return "Could not open image. Please try a different file.", 400
+
+        seed = request.form.get("seed")
+        _set_tiles(split_image(img))
+        _set_state(shuffle_tiles(int(seed)) if (seed and seed.isdigit()) else shuffle_tiles())
+        _set_moves(0)
+        app.logger.info('new_game image_uploaded seed=%s filename="%s"', seed, filename)
+    else:
+        # Shared link support: /?state=1,2,3,4,5,6,7,8,0
+        qs = request.args.get("state")
+        if qs:
+            try:
+                st = [int(x) for x in qs.split(",")]
+                if sorted(st) == list(range(9)) and is_solvable(st):
+                    _set_state(st)
+                    _set_moves(0)
+                    app.logger.info("state_loaded_from_query")
+            except Exception:
+                pass
+
+    tiles = _get_tiles()
+    state = _get_state()
+    moves = _get_moves()
+
+    return _TEMPLATE.render(state=list(state), moves=moves, tiles=tiles)
 
 @app.route("/move", methods=["POST"])
 def move_tile():
-    st = _get_state()
-    if not st:
-        return jsonify({"state": st, "move_count": _get_moves(), "solved": False})
-
     try:
         tile = int(request.form["tile"])
     except Exception:
-        return jsonify({"state": st, "move_count": _get_moves(), "solved": False})
-
-    blank = st.index(0)
-    ti = st.index(tile)
-    rb, cb = divmod(blank, 3)
-    rt, ct = divmod(ti, 3)
-
-    if abs(rb - rt) + abs(cb - ct) == 1:
-        st[blank], st[ti] = st[ti], st[blank]
-        _set_state(st)
-        _set_moves(_get_moves() + 1)
-        solved = st == list(range(1, 9)) + [0]
-        return jsonify({"state": st, "move_count": _get_moves(), "solved": solved})
+        tile = 0  # ignored by _slide_tile, which still reports the current board
 
-    return jsonify({"state": st, "move_count": _get_moves(), "solved": False})
+    state, moves, solved = _slide_tile(tile)
+    return jsonify({"state": state, "move_count": moves, "solved": solved})
 
 @app.route("/solution")
 def show_solution():
-    _set_state(list(range(1, 9)) + [0])
-    return jsonify({"state": _get_state()})
+    _set_state(SOLVED_STATE)
+    return jsonify({"state": list(_get_state())})
 
 @app.route("/minimum-moves")
 def minimum_moves():
     st = _get_state()
     heur = request.args.get("heuristic", "manhattan")
-    if st and is_solvable(st):
-        moves, _ = a_star_with_path(st, heur)
+    moves = optimal_moves(st, heur) if st else None
+    if moves is not None:
         return jsonify({"minimum_moves": moves, "heuristic": heur})
     return jsonify({"error": "This puzzle state is not solvable or not started"})
 
@@ -421,18 +664,17 @@ def minimum_moves():
 def solve():
     st = _get_state()
     heur = request.args.get("heuristic", "manhattan")
-    if st and is_solvable(st):
-        moves, path = a_star_with_path(st, heur)
-        return jsonify({"moves": moves, "path": [list(p) for p in path], "heuristic": heur})
+    path = optimal_path(st) if st else None
+    if path is not None:
+        return jsonify({"moves": len(path), "path": [list(p) for p in path], "heuristic": heur})
     return jsonify({"error": "No solution available"})
 
 @app.route("/hint")
 def hint():
     st = _get_state()
-    if st and is_solvable(st):
-        _, path = a_star_with_path(st, "manhattan")
-        if path:
-            return jsonify({"next_state": list(path[0])})
+    path = optimal_path(st) if st else None
+    if path:
+        return jsonify({"next_state": list(path[0])})
     return jsonify({"error": "No hint available"})
 
 @app.route("/reset", methods=["POST"])
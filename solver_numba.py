@@ -0,0 +1,137 @@
+# solver_numba.py
+# Numba-compiled A* (Manhattan heuristic) over packed boards: 4 bits per tile,
+# cell i -> bits 4*i..4*i+3, matching encode()/decode() in app.py.
+import numpy as np
+from numba import njit, types
+from numba.typed import Dict
+
+# Neighbour cells of each blank position, padded with -1
+_NBRS = np.array([
+    [1, 3, -1, -1], [0, 2, 4, -1], [1, 5, -1, -1],
+    [0, 4, 6, -1], [1, 3, 5, 7], [2, 4, 8, -1],
+    [3, 7, -1, -1], [4, 6, 8, -1], [5, 7, -1, -1],
+], dtype=np.int64)
+
+# _MDIST[v*9 + p]: Manhattan distance of tile v at cell p (blank costs 0)
+_MDIST = np.array([
+    abs((v - 1) // 3 - p // 3) + abs((v - 1) % 3 - p % 3) if v else 0
+    for v in range(9) for p in range(9)
+], dtype=np.int64)
+
+_STATE_BITS = 36
+_STATE_MASK = (1 << _STATE_BITS) - 1
+
+
+@njit(cache=True)
+def _blank(packed):
+    for i in range(9):
+        if (packed >> (4 * i)) & 0xF == 0:
+            return i
+    return -1
+
+
+@njit(cache=True)
+def _manhattan(packed):
+    d = 0
+    for i in range(9):
+        v = (packed >> (4 * i)) & 0xF
+        d += _MDIST[v * 9 + i]
+    return d
+
+
+@njit(cache=True)
+def _sift_up(heap, i):
+    entry = heap[i]
+    while i > 0:
+        parent = (i - 1) >> 1
+        if heap[parent] <= entry:
+            break
+        heap[i] = heap[parent]
+        i = parent
+    heap[i] = entry
+
+
+@njit(cache=True)
+def _sift_down(heap, n, i):
+    entry = heap[i]
+    while True:
+        child = 2 * i + 1
+        if child >= n:
+            break
+        if child + 1 < n and heap[child + 1] < heap[child]:
+            child += 1
+        if entry <= heap[child]:
+            break
+        heap[i] = heap[child]
+        i = child
+    heap[i] = entry
+
+
+@njit(cache=True)
+def _astar(start, goal):
+    """Optimal (moves, path) from start to goal; path excludes start. (-1, []) if unreachable."""
+    g = Dict.empty(key_type=types.int64, value_type=types.int32)
+    parent = Dict.empty(key_type=types.int64, value_type=types.int64)
+    closed = Dict.empty(key_type=types.int64, value_type=types.boolean)
+
+    # Heap entries are f << 36 | state, so int64 order is (f, state) order
+    heap = np.empty(1 << 14, dtype=np.int64)
+    g[start] = np.int32(0)
+    parent[start] = -1
+    heap[0] = (np.int64(_manhattan(start)) << _STATE_BITS) | start
+    n = 1
+
+    while n > 0:
+        top = heap[0]
+        n -= 1
+        if n > 0:
+            heap[0] = heap[n]
+            _sift_down(heap, n, 0)
+        cur = top & _STATE_MASK
+        if cur in closed:
+            continue
+        closed[cur] = True
+
+        if cur == goal:
+            moves = np.int64(g[cur])
+            path = np.empty(moves, dtype=np.int64)
+            k = moves - 1
+            while k >= 0:
+                path[k] = cur
+                cur = parent[cur]
+                k -= 1
+            return moves, path
+
+        f = top >> _STATE_BITS
+        gc = g[cur]
+        hc = f - gc
+        ng = gc + 1
+        zi = _blank(cur)
+        for k in range(4):
+            ni = _NBRS[zi, k]
+            if ni < 0:
+                break
+            v = (cur >> (4 * ni)) & 0xF
+            nxt = cur ^ (v << (4 * ni)) ^ (v << (4 * zi))
+            if nxt in closed:
+                continue
+            if nxt in g and g[nxt] <= ng:
+                continue
+            g[nxt] = np.int32(ng)
+            parent[nxt] = cur
+            hn = hc - _MDIST[v * 9 + ni] + _MDIST[v * 9 + zi]
+            if n == heap.shape[0]:
+                grown = np.empty(2 * n, dtype=np.int64)
+                grown[:n] = heap
+                heap = grown
+            heap[n] = (np.int64(ng + hn) << _STATE_BITS) | nxt
+            _sift_up(heap, n)
+            n += 1
+
+    return np.int64(-1), np.empty(0, dtype=np.int64)
+
+
+def astar(start: int, goal: int):
+    """Run the compiled A* on packed boards; returns (moves, [packed states])."""
+    moves, path = _astar(np.int64(start), np.int64(goal))
+    return int(moves), [int(p) for p in path]